@@ -96,6 +96,15 @@ def pytest_addoption(parser: pytest.Parser):
     )
 
 
+def pytest_configure(config: pytest.Config):
+    """
+    When tests are distributed with pytest-xdist (`pytest -n <N>`), use the `loadgroup` scheduler so that tests marked
+    with `xdist_group` are run on the same worker.
+    """
+    if config.pluginmanager.hasplugin("xdist") and config.getoption("dist", default="no") == "load":
+        config.option.dist = "loadgroup"
+
+
 def pytest_generate_tests(metafunc: pytest.Metafunc):
     """
     This function will add parameterizations for the `config` fixture depending on what types of config the test
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import types
 from unittest import mock
 
 import pytest
@@ -49,7 +50,5 @@ def mock_nemollm_fixture(mock_nemollm):
 
 @pytest.fixture(name="mock_nemo_service")
 def mock_nemo_service_fixture(mock_nemollm: mock.MagicMock):
-    mock_nemo_service = mock.MagicMock()
-    mock_nemo_service.return_value = mock_nemo_service
-    mock_nemo_service._conn = mock_nemollm
-    return mock_nemo_service
+    # NeMoLLMClient only ever accesses the `_conn` attribute of its parent service
+    return types.SimpleNamespace(_conn=mock_nemollm)
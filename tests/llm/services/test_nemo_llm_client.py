@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+import types
 from unittest import mock
 
 import pytest
@@ -22,36 +23,55 @@ from morpheus.llm.services.llm_service import LLMClient
 from morpheus.llm.services.nemo_llm_service import NeMoLLMClient
 
 
-def test_constructor(mock_nemollm: mock.MagicMock, mock_nemo_service: mock.MagicMock):
+class _Recorder:
+    """
+    Minimal stand-in for a mocked callable, records the keyword arguments of each call.
+    """
+    __slots__ = ('calls', 'return_value')
+
+    def __init__(self, return_value=None):
+        self.calls = []
+        self.return_value = return_value
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.return_value
+
+
+def _make_stub_nemo_service(return_value: list[str]) -> types.SimpleNamespace:
+    return types.SimpleNamespace(_conn=types.SimpleNamespace(generate_multiple=_Recorder(return_value)))
+
+
+def test_constructor(mock_nemollm: mock.MagicMock, mock_nemo_service: types.SimpleNamespace):
     client = NeMoLLMClient(mock_nemo_service, "test_model", additional_arg="test_arg")
     assert isinstance(client, LLMClient)
     mock_nemollm.assert_not_called()
 
 
-def test_get_input_names(mock_nemollm: mock.MagicMock, mock_nemo_service: mock.MagicMock):
+def test_get_input_names(mock_nemollm: mock.MagicMock, mock_nemo_service: types.SimpleNamespace):
     client = NeMoLLMClient(mock_nemo_service, "test_model", additional_arg="test_arg")
     assert client.get_input_names() == ["prompt"]
     mock_nemollm.assert_not_called()
 
 
-def test_generate(mock_nemollm: mock.MagicMock, mock_nemo_service: mock.MagicMock):
-    client = NeMoLLMClient(mock_nemo_service, "test_model", additional_arg="test_arg")
+def test_generate():
+    stub_nemo_service = _make_stub_nemo_service(["test_output"])
+
+    client = NeMoLLMClient(stub_nemo_service, "test_model", additional_arg="test_arg")
     assert client.generate({'prompt': "test_prompt"}) == "test_output"
-    mock_nemollm.generate_multiple.assert_called_once_with(model="test_model",
-                                                           prompts=["test_prompt"],
-                                                           return_type="text",
-                                                           additional_arg="test_arg")
+    assert stub_nemo_service._conn.generate_multiple.calls == [
+        dict(model="test_model", prompts=["test_prompt"], return_type="text", additional_arg="test_arg")
+    ]
 
 
-def test_generate_batch(mock_nemollm: mock.MagicMock, mock_nemo_service: mock.MagicMock):
-    mock_nemollm.generate_multiple.return_value = ["output1", "output2"]
+def test_generate_batch():
+    stub_nemo_service = _make_stub_nemo_service(["output1", "output2"])
 
-    client = NeMoLLMClient(mock_nemo_service, "test_model", additional_arg="test_arg")
+    client = NeMoLLMClient(stub_nemo_service, "test_model", additional_arg="test_arg")
     assert client.generate_batch({'prompt': ["prompt1", "prompt2"]}) == ["output1", "output2"]
-    mock_nemollm.generate_multiple.assert_called_once_with(model="test_model",
-                                                           prompts=["prompt1", "prompt2"],
-                                                           return_type="text",
-                                                           additional_arg="test_arg")
+    assert stub_nemo_service._conn.generate_multiple.calls == [
+        dict(model="test_model", prompts=["prompt1", "prompt2"], return_type="text", additional_arg="test_arg")
+    ]
 
 
 @mock.patch("asyncio.wrap_future")
@@ -60,7 +80,7 @@ def test_generate_async(
         mock_asyncio_gather: mock.AsyncMock,
         mock_asyncio_wrap_future: mock.MagicMock,  # pylint: disable=unused-argument
         mock_nemollm: mock.MagicMock,
-        mock_nemo_service: mock.MagicMock):
+        mock_nemo_service: types.SimpleNamespace):
     mock_asyncio_gather.return_value = [mock.MagicMock()]
 
     client = NeMoLLMClient(mock_nemo_service, "test_model", additional_arg="test_arg")
@@ -78,7 +98,7 @@ def test_generate_batch_async(
         mock_asyncio_gather: mock.AsyncMock,
         mock_asyncio_wrap_future: mock.MagicMock,  # pylint: disable=unused-argument
         mock_nemollm: mock.MagicMock,
-        mock_nemo_service: mock.MagicMock):
+        mock_nemo_service: types.SimpleNamespace):
     mock_asyncio_gather.return_value = [mock.MagicMock(), mock.MagicMock()]
     mock_nemollm.post_process_generate_response.side_effect = [{"text": "output1"}, {"text": "output2"}]
 
@@ -97,7 +117,7 @@ def test_generate_batch_async_error(
         mock_asyncio_gather: mock.AsyncMock,
         mock_asyncio_wrap_future: mock.MagicMock,  # pylint: disable=unused-argument
         mock_nemollm: mock.MagicMock,
-        mock_nemo_service: mock.MagicMock):
+        mock_nemo_service: types.SimpleNamespace):
     mock_asyncio_gather.return_value = [mock.MagicMock(), mock.MagicMock()]
     mock_nemollm.post_process_generate_response.return_value = {"status": "fail", "msg": "unittest"}
 
@@ -17,9 +17,11 @@
 import gc
 import typing
 
+import pandas as pd
 import pytest
 
 from _utils import assert_results
+from _utils.dataset_manager import DatasetManager
 from _utils.stages.conv_msg import ConvMsg
 from _utils.stages.in_memory_multi_source_stage import InMemoryMultiSourceStage
 from _utils.stages.in_memory_source_x_stage import InMemSourceXStage
@@ -91,10 +93,23 @@ class SinkTestStage(InMemorySinkStage):
             self._destructor_cb()
 
 
-def _run_pipeline(filter_probs_df: DataFrameType,
-                  source_callbacks: dict[str, typing.Callable[[], None]],
-                  sink_callbacks: dict[str, typing.Callable[[], None]]):
-    config = Config()
+def _run_pipeline(config: Config, filter_probs_df: DataFrameType) -> dict[str, bool]:
+    """
+    Runs a pipeline with both the destructor and startup callbacks wired in, returning a dictionary recording which of
+    the callbacks were invoked.
+    """
+    state_dict = {"source": False, "sink": False, "on_start": False, "start_async": False}
+
+    def update_state_dict(key: str):
+        state_dict[key] = True
+
+    source_callbacks = {'destructor_cb': lambda: update_state_dict("source")}
+    sink_callbacks = {
+        'on_start_cb': lambda: update_state_dict("on_start"),
+        'start_async_cb': lambda: update_state_dict("start_async"),
+        'destructor_cb': lambda: update_state_dict("sink")
+    }
+
     pipe = LinearPipeline(config)
     pipe.set_source(SourceTestStage(config, [filter_probs_df], **source_callbacks))
     pipe.add_stage(SinkTestStage(config, **sink_callbacks))
@@ -103,52 +118,69 @@ def _run_pipeline(filter_probs_df: DataFrameType,
         # The sink stage ensures that the on_start callback method still works, even though it is deprecated.
         pipe.run()
 
+    return state_dict
 
-@pytest.mark.use_cudf
-def test_destructors_called(filter_probs_df: DataFrameType):
+
+@pytest.fixture(name="_pipeline_state_cache", scope="module")
+def _pipeline_state_cache_fixture():
+    yield {}
+
+
+@pytest.fixture(name="pipeline_state")
+def pipeline_state_fixture(_pipeline_state_cache: dict[bool, dict[str, bool]],
+                           use_cpp: bool,
+                           config: Config,
+                           filter_probs_df: DataFrameType):
     """
-    Test to ensure that the destructors of stages are called (issue #1114).
+    Builds and runs the callback test pipeline once per C++/Python mode, sharing the captured state between tests.
+    `config`, `filter_probs_df` and `use_cpp` are function scoped, so the results are cached in a module scoped dict
+    instead.
     """
-    state_dict = {"source": False, "sink": False}
+    if use_cpp not in _pipeline_state_cache:
+        state_dict = _run_pipeline(config, filter_probs_df)
 
-    def update_state_dict(key: str):
-        nonlocal state_dict
-        state_dict[key] = True
+        # Ensure the stages are released before we check that the destructors were called
+        gc.collect()
+        _pipeline_state_cache[use_cpp] = state_dict
 
-    source_callbacks = {'destructor_cb': lambda: update_state_dict("source")}
-    sink_callbacks = {'destructor_cb': lambda: update_state_dict("sink")}
+    yield _pipeline_state_cache[use_cpp]
 
-    _run_pipeline(filter_probs_df, source_callbacks, sink_callbacks)
 
-    gc.collect()
-    assert state_dict["source"]
-    assert state_dict["sink"]
+@pytest.fixture(name="expected_scored_df", scope="module")
+def expected_scored_df_fixture():
+    """
+    The expected output of `test_pipeline_narrowing_types`, built once from the pandas copy of filter_probs.csv cached
+    by `DatasetManager` rather than converting `filter_probs_df` from cudf in each test.
+    """
+    df = DatasetManager(df_type='pandas')["filter_probs.csv"]
+    yield df.rename(columns=dict(zip(df.columns, ['frogs', 'lizards', 'toads', 'turtles'])))
 
 
+# When run with pytest-xdist, keep the cudf tests on a single worker to avoid contention for the GPU, and to allow the
+# callback tests to share the results in `_pipeline_state_cache`. The remaining tests are free to be distributed.
+@pytest.mark.xdist_group("pipeline_cudf")
 @pytest.mark.use_cudf
-def test_startup_cb_called(filter_probs_df: DataFrameType):
+def test_destructors_called(pipeline_state: dict[str, bool]):
     """
     Test to ensure that the destructors of stages are called (issue #1114).
     """
-    state_dict = {"on_start": False, "start_async": False}
+    assert pipeline_state["source"]
+    assert pipeline_state["sink"]
 
-    def update_state_dict(key: str):
-        nonlocal state_dict
-        state_dict[key] = True
 
-    sink_callbacks = {
-        'on_start_cb': lambda: update_state_dict("on_start"),
-        'start_async_cb': lambda: update_state_dict("start_async")
-    }
-
-    _run_pipeline(filter_probs_df, source_callbacks={}, sink_callbacks=sink_callbacks)
-
-    assert state_dict["on_start"]
-    assert state_dict["start_async"]
+@pytest.mark.xdist_group("pipeline_cudf")
+@pytest.mark.use_cudf
+def test_startup_cb_called(pipeline_state: dict[str, bool]):
+    """
+    Test to ensure that the `on_start` and `start_async` methods of stages are called.
+    """
+    assert pipeline_state["on_start"]
+    assert pipeline_state["start_async"]
 
 
+@pytest.mark.xdist_group("pipeline_cudf")
 @pytest.mark.use_cudf
-def test_pipeline_narrowing_types(config: Config, filter_probs_df: DataFrameType):
+def test_pipeline_narrowing_types(config: Config, filter_probs_df: DataFrameType, expected_scored_df: pd.DataFrame):
     """
     Test to ensure that we aren't narrowing the types of messages in the pipeline.
 
@@ -156,9 +188,7 @@ def test_pipeline_narrowing_types(config: Config, filter_probs_df: DataFrameType
     which is the accepted type for `MultiMessagePassThruStage`. We want to ensure that the type is retained allowing us
     to place a stage after `MultiMessagePassThruStage` requring `MultiResponseMessage` like `AddScoresStage`.
     """
-    config.class_labels = ['frogs', 'lizards', 'toads', 'turtles']
-    expected_df = filter_probs_df.to_pandas()
-    expected_df = expected_df.rename(columns=dict(zip(expected_df.columns, config.class_labels)))
+    config.class_labels = list(expected_scored_df.columns)
 
     pipe = LinearPipeline(config)
     pipe.set_source(InMemorySourceStage(config, [filter_probs_df]))
@@ -167,7 +197,7 @@ def test_pipeline_narrowing_types(config: Config, filter_probs_df: DataFrameType
     pipe.add_stage(MultiMessagePassThruStage(config))
     pipe.add_stage(AddScoresStage(config))
     pipe.add_stage(SerializeStage(config, include=[f"^{c}$" for c in config.class_labels]))
-    compare_stage = pipe.add_stage(CompareDataFrameStage(config, compare_df=expected_df))
+    compare_stage = pipe.add_stage(CompareDataFrameStage(config, compare_df=expected_scored_df))
     pipe.run()
 
     assert_results(compare_stage.get_results())